@@ -3,52 +3,223 @@ import os
 import time
 import google.generativeai as genai
 import tempfile
-from tavily import TavilyClient
+import shutil
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 import base64
+import random
+import hashlib
+import re
+import threading
+import html
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from google.api_core.exceptions import DeadlineExceeded, NotFound, PermissionDenied, ResourceExhausted, ServiceUnavailable
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 # Configure Gemini API
 GEMINI_API_KEY = st.secrets['GEMINI_API_KEY']
-genai.configure(api_key=GEMINI_API_KEY)
+
+# Request timeouts (seconds) for Gemini calls. A streamed call's deadline covers the whole
+# generation, so it is set well above the time a long 4096-token answer takes to stream.
+# Timed-out streams are not retried, so a stalled stream blocks for at most STREAM_TIMEOUT.
+CALL_TIMEOUT = 15
+STREAM_TIMEOUT = 300
+
+# Asks for the summary and title in one response so they cost a single Gemini call
+SUMMARY_PROMPT = (
+    "Return exactly two sections titled 'SUMMARY:' (the main topic or subject of this PDF in 2-3 sentences) "
+    "and 'TITLE:' (a concise and descriptive title, maximum 5 words)."
+)
+
+# Fallback title, and the shortest summary worth searching related articles for
+DEFAULT_TITLE = "Untitled Document"
+MIN_SUMMARY_WORDS = 20
 
 # Configure Tavily API
 TAVILY_API_KEY = st.secrets['TAVILY_API_KEY']
-tavily_client = TavilyClient(api_key=TAVILY_API_KEY)
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+
+# One keep-alive session per process so searches reuse warm TCP/TLS connections
+@st.cache_resource(show_spinner=False)
+def get_tavily_session():
+    session = requests.Session()
+    session.headers.update({"Authorization": f"Bearer {TAVILY_API_KEY}"})
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+    return session
+
+# Caps on in-flight API calls across all sessions, to stay under provider rate limits
+GEMINI_MAX_CONCURRENCY = 8
+# Seconds to wait for a free Gemini slot before giving up with an error
+GEMINI_SLOT_TIMEOUT = 30
+TAVILY_MAX_CONCURRENCY = 4
+
+@st.cache_resource(show_spinner=False)
+def get_gemini_limiter():
+    return threading.BoundedSemaphore(GEMINI_MAX_CONCURRENCY)
+
+@st.cache_resource(show_spinner=False)
+def get_tavily_limiter():
+    return threading.BoundedSemaphore(TAVILY_MAX_CONCURRENCY)
+
+def acquire_gemini_slot():
+    limiter = get_gemini_limiter()
+    if not limiter.acquire(timeout=GEMINI_SLOT_TIMEOUT):
+        raise ResourceExhausted("Too many requests to Gemini are in progress. Please try again shortly.")
+    return limiter
+
+# Every Gemini call, including the file API, runs while holding a slot
+def with_gemini_slot(method, *args, **kwargs):
+    limiter = acquire_gemini_slot()
+    try:
+        return method(*args, **kwargs)
+    finally:
+        limiter.release()
 
 def upload_to_gemini(uploaded_file):
     with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-        tmp_file.write(uploaded_file.getvalue())
+        uploaded_file.seek(0)
+        shutil.copyfileobj(uploaded_file, tmp_file, length=1024 * 1024)
         tmp_file_path = tmp_file.name
 
     try:
-        uploaded_file = genai.upload_file(tmp_file_path, mime_type="application/pdf")
+        uploaded_file = with_gemini_slot(genai.upload_file, tmp_file_path, mime_type="application/pdf")
         return uploaded_file
     finally:
         os.unlink(tmp_file_path)
 
-def wait_for_file_active(file):
+def file_sha256(uploaded_file):
+    uploaded_file.seek(0)
+    file_hash = hashlib.file_digest(uploaded_file, "sha256")
+    uploaded_file.seek(0)
+    return file_hash.hexdigest()
+
+# Content hash -> Gemini file name, shared by all sessions
+@st.cache_resource(show_spinner=False)
+def get_uploaded_files():
+    return {}
+
+def get_gemini_file(uploaded_file):
+    uploaded_files = get_uploaded_files()
+    file_hash = file_sha256(uploaded_file)
+
+    file_name = uploaded_files.get(file_hash)
+    if file_name is not None:
+        # Gemini deletes files after 48 hours and reports them as missing or forbidden
+        try:
+            file = with_gemini_slot(genai.get_file, file_name)
+            if file.state.name != "FAILED":
+                return file
+        except (NotFound, PermissionDenied):
+            pass
+        logger.info("Cached Gemini file %s is unusable, uploading again.", file_name)
+        uploaded_files.pop(file_hash, None)
+
+    file = upload_to_gemini(uploaded_file)
+    uploaded_files[file_hash] = file.name
+    return file
+
+def wait_for_file_active(file, timeout=120):
     with st.spinner("Processing file..."):
-        file_status = genai.get_file(file.name)
-        while file_status.state.name == "PROCESSING":
-            time.sleep(2)
-            file_status = genai.get_file(file.name)
+        delay = 0.25
+        deadline = time.monotonic() + timeout
+        file_status = with_gemini_slot(genai.get_file, file.name)
+        while file_status.state.name == "PROCESSING" and time.monotonic() < deadline:
+            time.sleep(delay)
+            delay = min(delay * 1.5, 2.0)  # Exponential backoff
+            file_status = with_gemini_slot(genai.get_file, file.name)
         if file_status.state.name != "ACTIVE":
             st.error(f"File {file.name} failed to process")
             return False
     return True
 
+def retry_gemini(request, max_retries=3, retryable=(DeadlineExceeded, ServiceUnavailable)):
+    for attempt in range(max_retries):
+        try:
+            return request()
+        except retryable as e:
+            logger.warning("Gemini request failed (attempt %d): %s", attempt + 1, e)
+            if attempt == max_retries - 1:
+                raise
+            time.sleep(2 ** attempt + random.uniform(0, 1))  # Exponential backoff with jitter
+
+def call_gemini(method, *args, timeout=CALL_TIMEOUT, **kwargs):
+    return retry_gemini(lambda: with_gemini_slot(method, *args, request_options={"timeout": timeout}, **kwargs))
+
+# Yields the response text, holding a concurrency slot until the whole stream has been consumed.
+# Only the request up to the first chunk is retried, and only when the service is unavailable:
+# a timeout has already used the whole STREAM_TIMEOUT. Errors while streaming reach the caller.
+def stream_gemini(method, *args, **kwargs):
+    def request():
+        limiter = acquire_gemini_slot()
+        try:
+            return method(*args, stream=True, request_options={"timeout": STREAM_TIMEOUT}, **kwargs)
+        except BaseException:
+            limiter.release()
+            raise
+
+    response = retry_gemini(request, retryable=(ServiceUnavailable,))
+    try:
+        for chunk in response:
+            yield chunk.text
+    finally:
+        get_gemini_limiter().release()
+
+# Matches a "TITLE:", "**Title**:" or bare "## TITLE" label at the start of a line, in any case
+def section_label(name):
+    return re.compile(rf"^[#*\s]*{name}\b[* \t]*(?::|$)[* \t]*", re.IGNORECASE | re.MULTILINE)
+
+SUMMARY_LABEL = section_label("SUMMARY")
+TITLE_LABEL = section_label("TITLE")
+
+# A section runs from its label to the other label, or to the end of the text
+def section_text(text, match, other):
+    if not match:
+        return ""
+    end = other.start() if other and other.start() > match.start() else len(text)
+    return text[match.end():end].strip()
+
+def parse_summary_and_title(text):
+    summary_match = SUMMARY_LABEL.search(text)
+    title_match = TITLE_LABEL.search(text)
+
+    summary = section_text(text, summary_match, title_match)
+    title_line = section_text(text, title_match, summary_match).split("\n", 1)[0]
+    title = title_line.strip(' "*#')
+
+    if not summary:
+        # No usable SUMMARY section; fall back to the reply without its title label and line
+        summary = text
+        if title_match:
+            title_end = text.index(title_line, title_match.end()) + len(title_line)
+            summary = text[:title_match.start()] + text[title_end:]
+        summary = SUMMARY_LABEL.sub("", summary).strip() or text.strip()
+    return summary, title
+
 def generate_title_from_summary(model, summary):
     prompt = f"Given the following summary of a document, generate a concise and descriptive title (maximum 5 words):\n\n{summary}\n\nTitle:"
     try:
-        response = model.generate_content(prompt)
+        response = call_gemini(model.generate_content, prompt)
         return response.text.strip()
     except Exception as e:
-        logging.error(f"Error generating title: {str(e)}")
-        return "Untitled Document"
+        logger.error("Error generating title: %s", e)
+        return DEFAULT_TITLE
+
+# Failed searches raise and are not cached, so tavily_search still retries them
+@st.cache_data(show_spinner=False, ttl=60 * 60)
+def search_tavily_cached(query):
+    with get_tavily_limiter():
+        response = get_tavily_session().post(
+            TAVILY_SEARCH_URL,
+            json={"query": query, "search_depth": "advanced", "include_images": False, "include_answer": True, "max_results": 5},
+            timeout=60,
+        )
+    response.raise_for_status()
+    return response.json()
 
 def tavily_search(query, max_retries=3):
     if not query.strip():
@@ -56,19 +227,115 @@ def tavily_search(query, max_retries=3):
 
     for attempt in range(max_retries):
         try:
-            logging.info(f"Attempting Tavily search (attempt {attempt + 1})")
-            response = tavily_client.search(query=query, search_depth="advanced", include_images=False, include_answer=True, max_results=5)
-            logging.info(f"Tavily search successful: {response}")
+            logger.info("Attempting Tavily search (attempt %d)", attempt + 1)
+            response = search_tavily_cached(query)
+            logger.info("Tavily search successful.")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Tavily response: %s", response)
             return response
         except requests.exceptions.HTTPError as e:
-            logging.error(f"HTTP error in Tavily search (attempt {attempt + 1}): {str(e)}")
+            logger.error("HTTP error in Tavily search (attempt %d): %s", attempt + 1, e)
             if attempt == max_retries - 1:
                 return None
             time.sleep(2 ** attempt)  # Exponential backoff
         except Exception as e:
-            logging.error(f"Unexpected error in Tavily search: {str(e)}")
+            logger.error("Unexpected error in Tavily search: %s", e)
             return None
 
+def get_preconnect_html(results):
+    origins = set()
+    for result in results:
+        url = urlparse(result.get('url', ''))
+        if url.scheme in ("http", "https") and url.netloc:
+            origins.add(f"{url.scheme}://{url.netloc}")
+    return "".join(f'<link rel="preconnect" href="{html.escape(origin)}">' for origin in sorted(origins))
+
+# Shared across sessions so background searches don't each spin up a pool
+@st.cache_resource(show_spinner=False)
+def get_executor():
+    return ThreadPoolExecutor(max_workers=4)
+
+def process_uploaded_file(gemini_file, model, title_model, summary_placeholder):
+    summary_stream = stream_gemini(
+        model.generate_content,
+        [gemini_file, SUMMARY_PROMPT],
+        generation_config=summary_generation_config,
+    )
+    try:
+        with summary_placeholder.container():
+            summary_text = st.write_stream(summary_stream)
+    except Exception as e:
+        logger.error("Error summarizing PDF: %s", e)
+        st.error("Couldn't summarize the PDF. Please try uploading it again.")
+        return None
+    pdf_summary, pdf_title = parse_summary_and_title(summary_text)
+
+    # Only spend a second call on the title if the model left it out
+    if not pdf_title:
+        pdf_title = generate_title_from_summary(title_model, pdf_summary)
+
+    # Skip the search when there's no real title or too little to go on
+    if not pdf_title or pdf_title == DEFAULT_TITLE:
+        return summary_text, pdf_summary, pdf_title, None, "no_title"
+    if len(pdf_summary.split()) <= MIN_SUMMARY_WORDS:
+        return summary_text, pdf_summary, pdf_title, None, "short_summary"
+
+    # Search in the background; the result is collected when the sidebar renders
+    search_future = get_executor().submit(tavily_search, f"Articles related to: {pdf_title}")
+    return summary_text, pdf_summary, pdf_title, search_future, None
+
+# Start the chat on the first question, seeded with the summary exchange and any earlier turns
+def get_chat_session(model):
+    if 'chat_session' not in st.session_state:
+        gemini_file = with_gemini_slot(genai.get_file, st.session_state.gemini_file_name)
+        history = [
+            {"role": "user", "parts": [gemini_file, SUMMARY_PROMPT]},
+            {"role": "model", "parts": [st.session_state.summary_text]},
+        ]
+        for message in st.session_state.chat_history:
+            history.append({"role": "user" if message["role"] == "user" else "model", "parts": [message["content"]]})
+        st.session_state.chat_session = model.start_chat(history=history)
+    return st.session_state.chat_session
+
+# Runs as a fragment so chat submissions rerun only the chat, not the whole page
+@st.fragment
+def render_chat(model):
+    # Chat container
+    chat_container = st.container()
+
+    # User input for questions
+    user_question = st.chat_input("Ask a question about the PDF:")
+
+    # Display chat history
+    with chat_container:
+        for message in st.session_state.chat_history:
+            with st.chat_message(message["role"], avatar="👤" if message["role"] == "user" else "🤖"):
+                st.markdown(message["content"])
+
+        if user_question:
+            with st.chat_message("user", avatar="👤"):
+                st.markdown(user_question)
+
+            # Stream the response as it is generated
+            with st.chat_message("assistant", avatar="🤖"):
+                try:
+                    # Held out of session state while streaming, so a failed or interrupted turn leaves
+                    # no half-finished session behind; the next question rebuilds it from chat_history
+                    chat_session = get_chat_session(model)
+                    del st.session_state.chat_session
+                    response_text = st.write_stream(stream_gemini(chat_session.send_message, user_question))
+                except (NotFound, PermissionDenied) as e:
+                    # Gemini deletes uploaded files after 48 hours
+                    logger.error("Gemini file for the chat is no longer available: %s", e)
+                    st.error("This PDF is no longer available to Gemini. Please upload it again.")
+                except Exception as e:
+                    logger.error("Error generating chat response: %s", e)
+                    st.error("Couldn't generate a response. Please try asking again.")
+                else:
+                    st.session_state.chat_session = chat_session
+                    st.session_state.chat_history.append({"role": "user", "content": user_question})
+                    st.session_state.chat_history.append({"role": "assistant", "content": response_text})
+
 # Create the Gemini model
 generation_config = {
     "temperature": 0.7,
@@ -77,148 +344,193 @@ generation_config = {
     "max_output_tokens": 4096,
 }
 
-model = genai.GenerativeModel(
-    model_name="gemini-1.5-pro",
-    generation_config=generation_config,
-)
+# Tighter budgets for the short, fixed-length outputs; 4096 is kept for free-form chat
+summary_generation_config = {
+    "max_output_tokens": 256,
+}
+
+title_generation_config = {
+    "temperature": 0.2,
+    "max_output_tokens": 16,
+}
+
+@st.cache_resource(show_spinner=False)
+def get_model():
+    genai.configure(api_key=GEMINI_API_KEY)
+    return genai.GenerativeModel(
+        model_name="gemini-1.5-pro",
+        generation_config=generation_config,
+    )
+
+model = get_model()
+
+# Titles are a few words, so a smaller, faster model is plenty
+@st.cache_resource(show_spinner=False)
+def get_title_model():
+    return genai.GenerativeModel(
+        model_name="gemini-1.5-flash",
+        generation_config=title_generation_config,
+    )
+
+title_model = get_title_model()
 
 # Load the logo.svg as a base64 string
+@st.cache_data(show_spinner=False)
 def load_logo():
     with open("logo.svg", "rb") as image_file:
         base64_image = base64.b64encode(image_file.read()).decode()
     return base64_image
 
-logo_base64 = load_logo()
-
-# Streamlit app
-st.set_page_config(page_title="DocuExplore", page_icon="logo.svg", layout="wide")
-
 # Custom CSS for a more professional look
-st.markdown(f"""
+CUSTOM_CSS = """
     <style>
-    .main .block-container {{
+    .main .block-container {
         padding-top: 4rem; /* Increased padding for the top */
         padding-bottom: 2rem;
-    }}
-    .stApp {{
+    }
+    .stApp {
         background-color: #f0f2f6;
-    }}
-    .st-bx {{
+    }
+    .st-bx {
         background-color: white;
         border-radius: 5px;
         padding: 20px;
         box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }}
-    .title-container {{
+    }
+    .title-container {
         display: flex;
         align-items: center;
         justify-content: space-between;
-    }}
-    .title-container .title {{
+    }
+    .title-container .title {
         font-size: 2rem;
         font-weight: bold;
         display: flex;
         align-items: center;
-    }}
-    .title-container .title img {{
+    }
+    .title-container .title img {
         margin-right: 10px; /* Padding between the logo and title */
-    }}
-    .title-container .subtitle {{
+    }
+    .title-container .subtitle {
         font-size: 1.2rem;
         color: #555;
-    }}
-    .product-hunt-badge {{
+    }
+    .product-hunt-badge {
         display: flex;
         align-items: center;
-    }}
+    }
     </style>
-    """, unsafe_allow_html=True)
-
-# Title and Product Hunt badge
-st.markdown(f"""
-    <div class="title-container">
-        <div>
-            <div class="title">
-                <img src="data:image/svg+xml;base64,{logo_base64}" alt="Logo" width="40" height="40">
-                DocuExplore
+    """
+
+# Title and Product Hunt badge, built once with the logo inlined
+@st.cache_data(show_spinner=False)
+def get_title_html():
+    logo_base64 = load_logo()
+    return f"""
+        <div class="title-container">
+            <div>
+                <div class="title">
+                    <img src="data:image/svg+xml;base64,{logo_base64}" alt="Logo" width="40" height="40">
+                    DocuExplore
+                </div>
+                <div class="subtitle">From PDF to Insight, Explore the Extra</div>
+            </div>
+            <div class="product-hunt-badge">
+                <a href="https://www.producthunt.com/posts/docuexplore?embed=true&utm_source=badge-featured&utm_medium=badge&utm_souce=badge-docuexplore" target="_blank">
+                    <img src="https://api.producthunt.com/widgets/embed-image/v1/featured.svg?post_id=474872&theme=dark" alt="DocuExplore - From PDF to Insight, Explore the Extra | Product Hunt" style="width: 250px; height: 54px;" width="250" height="54" />
+                </a>
             </div>
-            <div class="subtitle">From PDF to Insight, Explore the Extra</div>
-        </div>
-        <div class="product-hunt-badge">
-            <a href="https://www.producthunt.com/posts/docuexplore?embed=true&utm_source=badge-featured&utm_medium=badge&utm_souce=badge-docuexplore" target="_blank">
-                <img src="https://api.producthunt.com/widgets/embed-image/v1/featured.svg?post_id=474872&theme=dark" alt="DocuExplore - From PDF to Insight, Explore the Extra | Product Hunt" style="width: 250px; height: 54px;" width="250" height="54" />
-            </a>
         </div>
-    </div>
-""", unsafe_allow_html=True)
+    """
+
+# Streamlit app
+st.set_page_config(page_title="DocuExplore", page_icon="logo.svg", layout="wide")
+
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+st.markdown(get_title_html(), unsafe_allow_html=True)
 
 # Main content and sidebar layout
 col1, col2 = st.columns([2, 1])
 
 with col1:
     st.subheader("Chat Interface", anchor=False)
-    uploaded_file = st.file_uploader("Upload a PDF file", type="pdf")
+    # The uploader is reset after each upload attempt, which releases Streamlit's copy of the bytes
+    uploaded_file = st.file_uploader("Upload a PDF file", type="pdf", key=f"pdf_uploader_{st.session_state.get('uploader_key', 0)}")
 
     if 'chat_history' not in st.session_state:
         st.session_state.chat_history = []
 
+    # Anything in the uploader is a new document; drop state left over from the previous one
     if uploaded_file is not None:
-        if 'gemini_file' not in st.session_state:
-            with st.spinner("Uploading and processing file..."):
-                st.session_state.gemini_file = upload_to_gemini(uploaded_file)
-                
-                if wait_for_file_active(st.session_state.gemini_file):
-                    st.session_state.chat_session = model.start_chat(
-                        history=[
-                            {
-                                "role": "user",
-                                "parts": [st.session_state.gemini_file, "What is the main topic or subject of this PDF? Provide a brief summary in 2-3 sentences."],
-                            },
-                        ]
-                    )
-                    summary_response = st.session_state.chat_session.send_message("Provide the summary.")
-                    st.session_state.pdf_summary = summary_response.text
-                    st.session_state.chat_history = []
-
-                    # Generate title and search for related articles
-                    with st.spinner("Fetching related articles..."):
-                        pdf_title = generate_title_from_summary(model, st.session_state.pdf_summary)
-                        st.session_state.pdf_title = pdf_title
-                        search_query = f"Articles related to: {pdf_title}"
-                        st.session_state.search_results = tavily_search(search_query)
-
-        st.success("PDF processed successfully!")
+        for key in ('file_ready', 'chat_session', 'search_future', 'search_results', 'search_skipped'):
+            st.session_state.pop(key, None)
+
+        with st.spinner("Uploading and processing file..."):
+            try:
+                gemini_file = get_gemini_file(uploaded_file)
+                file_active = wait_for_file_active(gemini_file)
+            except ResourceExhausted as e:
+                logger.warning("No free Gemini slot while uploading PDF: %s", e)
+                st.error(e.message)
+                file_active = False
+
+            if file_active:
+                st.session_state.gemini_file_name = gemini_file.name
+                st.session_state.chat_history = []
+
+                # Summarize and start searching for related articles
+                with st.spinner("Summarizing PDF..."):
+                    summary_placeholder = st.empty()
+                    processed = process_uploaded_file(gemini_file, model, title_model, summary_placeholder)
+                    summary_placeholder.empty()
+
+                if processed is not None:
+                    summary_text, pdf_summary, pdf_title, search_future, search_skipped = processed
+                    st.session_state.summary_text = summary_text
+                    st.session_state.pdf_summary = pdf_summary
+                    st.session_state.pdf_title = pdf_title
+                    if search_future is not None:
+                        st.session_state.search_future = search_future
+                    else:
+                        st.session_state.search_skipped = search_skipped
+                    st.session_state.pdf_file_name = uploaded_file.name
+                    st.session_state.file_ready = True
+
+        # Clear the uploader whether or not processing succeeded, so a failed PDF isn't retried on every rerun
+        st.session_state.uploader_key = st.session_state.get('uploader_key', 0) + 1
+        if st.session_state.get('file_ready'):
+            st.rerun()
+
+    if st.session_state.get('file_ready'):
+        st.success(f"PDF processed successfully! ({st.session_state.pdf_file_name})")
         with st.expander("PDF Summary", expanded=True):
             st.write(st.session_state.pdf_summary)
             if 'pdf_title' in st.session_state:
                 st.write(f"**Generated Title:** {st.session_state.pdf_title}")
 
-        # Chat container
-        chat_container = st.container()
-
-        # User input for questions
-        user_question = st.chat_input("Ask a question about the PDF:")
-        
-        if user_question:
-            st.session_state.chat_history.append({"role": "user", "content": user_question})
-            
-            with st.spinner("Generating response..."):
-                response = st.session_state.chat_session.send_message(user_question)
-                st.session_state.chat_history.append({"role": "assistant", "content": response.text})
-
-        # Display chat history
-        with chat_container:
-            for message in st.session_state.chat_history:
-                with st.chat_message(message["role"], avatar="👤" if message["role"] == "user" else "🤖"):
-                    st.markdown(message["content"])
+        render_chat(model)
 
     else:
         st.info("Please upload a PDF file to start chatting.")
 
 with col2:
     st.subheader("Related Articles Here", anchor=False)
-    if 'search_results' in st.session_state:
+    if 'search_future' in st.session_state:
+        with st.spinner("Fetching related articles..."):
+            st.session_state.search_results = st.session_state.search_future.result()
+        del st.session_state.search_future
+
+    if st.session_state.get('search_skipped') == "no_title":
+        st.warning("Couldn't generate a title for this PDF, so related articles weren't searched.")
+    elif st.session_state.get('search_skipped') == "short_summary":
+        st.info("This PDF doesn't have enough content to search for related articles.")
+    elif 'search_results' in st.session_state:
         if st.session_state.search_results is not None:
+            # Let the browser open connections to the article sites before a link is clicked
+            preconnect_html = get_preconnect_html(st.session_state.search_results.get('results', []))
+            if preconnect_html:
+                st.markdown(preconnect_html, unsafe_allow_html=True)
+
             for result in st.session_state.search_results.get('results', []):
                 with st.expander(f"**{result.get('title', 'Untitled')}**", expanded=False):
                     st.write(f"[Read More]({result.get('url', '#')})")